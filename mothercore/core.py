@@ -18,9 +18,12 @@ This is a learning scaffold, not an actual AGI. It’s built to be:
 """
 
 from __future__ import annotations
-import json, os, sys, time, uuid, math, random, textwrap, datetime
+import json, os, re, sys, time, uuid, math, mmap, textwrap, threading, heapq, bisect, warnings, weakref
+from array import array
+from collections import Counter, deque
+from itertools import chain
 from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional, Tuple, Callable, Iterable
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Callable, Iterable
 import atexit
 
 # ----------------------------- Config & Constants -----------------------------
@@ -31,31 +34,39 @@ VERSION = "0.2.1"
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(SCRIPT_DIR, ".mothercore")  # create/use .mothercore inside your project folder
 os.makedirs(DATA_DIR, exist_ok=True)
+def _list_data_dir() -> set:
+    with os.scandir(DATA_DIR) as entries:
+        return {e.name for e in entries}
+
+# List DATA_DIR once at import; the existence checks below use this snapshot
+# instead of a stat() per file.
+_EXISTING = _list_data_dir()
 
 def _iso_stamp() -> str:
     # safe for filenames
-    return datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
 
 def _path_with_timestamp_if_exists(filename: str) -> str:
     """
-    If DATA_DIR/filename already exists, return a timestamped variant:
+    If DATA_DIR/filename already existed at import, return a timestamped variant:
     NAME_YYYYmmddThhmmssZ.EXT
     """
-    base = os.path.join(DATA_DIR, filename)
-    if os.path.exists(base):
+    if filename in _EXISTING:
         stem, ext = os.path.splitext(filename)
         return os.path.join(DATA_DIR, f"{stem}_{_iso_stamp()}{ext}")
-    return base
+    return os.path.join(DATA_DIR, filename)
 
 # If an older file exists, create a new one with a timestamp suffix
 AUDIT_LOG = _path_with_timestamp_if_exists("audit.log.jsonl")
 MEM_FILE  = _path_with_timestamp_if_exists("memory.jsonl")
 
 # Constitution is optional-on-disk: do NOT create it unless you explicitly write it later
-CONF_FILE = os.path.join(DATA_DIR, "constitution.json")
+CONF_NAME = "constitution.json"
+CONF_FILE = os.path.join(DATA_DIR, CONF_NAME)
 
 def now_iso() -> str:
-    return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    # straight from a struct_time; no datetime object per audit event
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
 def _maybe_remove_empty_data_dir():
     try:
@@ -101,14 +112,17 @@ DEFAULT_CONSTITUTION = {
 }
 
 def load_or_init_constitution(path: str = CONF_FILE) -> Dict[str, Any]:
-    if os.path.exists(path):
+    try:
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
+    except FileNotFoundError:
+        pass
     # with open(path, "w", encoding="utf-8") as f:
     #     json.dump(DEFAULT_CONSTITUTION, f, indent=2)
     return DEFAULT_CONSTITUTION
 
-CONSTITUTION = load_or_init_constitution()
+# skip even the open() attempt when the import-time listing shows no file
+CONSTITUTION = load_or_init_constitution() if CONF_NAME in _EXISTING else DEFAULT_CONSTITUTION
 
 # ----------------------------- Utilities -------------------------------------
 
@@ -118,22 +132,192 @@ def clamp(x: float, lo: float = 0.0, hi: float = 1.0) -> float:
 def short_id() -> str:
     return uuid.uuid4().hex[:8]
 
+def _env_int(name: str, default: int) -> int:
+    # a bad value must not make the package unimportable: warn and use the default
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        warnings.warn(f"{APP_NAME}: ignoring {name}={raw!r} (not an integer); using {default}", RuntimeWarning)
+        return default
+
+def _env_choice(name: str, default: str, choices: Tuple[str, ...]) -> str:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    if raw not in choices:
+        warnings.warn(f"{APP_NAME}: ignoring {name}={raw!r} (expected one of {choices}); using {default!r}",
+                      RuntimeWarning)
+        return default
+    return raw
+
+# Audit events are buffered in memory and appended to AUDIT_LOG in batches:
+# every AUDIT_BUFFER_SIZE events or every AUDIT_FLUSH_MS milliseconds.
+AUDIT_BUFFER_SIZE = _env_int("MOTHERCORE_AUDIT_BUFFER_SIZE", 500)
+AUDIT_FLUSH_MS = _env_int("MOTHERCORE_AUDIT_FLUSH_MS", 250)
+# Optional: stage serialized events in an mmap-backed ring of this many bytes
+# instead (0 = off). On overflow either "drop" the event (counted) or "block"
+# until the flusher frees space. Events larger than the whole ring are always
+# dropped (counted), and "block" also drops once the flusher thread is gone.
+AUDIT_RING_BYTES = _env_int("MOTHERCORE_AUDIT_RING_BYTES", 0)
+AUDIT_RING_OVERFLOW = _env_choice("MOTHERCORE_AUDIT_RING_OVERFLOW", "drop", ("drop", "block"))
+
+class AuditBuffer:
+    def __init__(self, path: str, buffer_size: int = AUDIT_BUFFER_SIZE, flush_ms: int = AUDIT_FLUSH_MS):
+        self.path = path
+        self.buffer_size = max(1, buffer_size)
+        self.flush_interval = max(1, flush_ms) / 1000.0
+        self.dropped = 0  # events lost to failed writes
+        self._events: deque = deque()  # serialized JSON lines, without "\n"
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # keeps concurrent flushes in log order
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def append(self, event: Dict[str, Any]) -> None:
+        # serialize now: bad events fail at the call site, and the log records
+        # nested lists as they were when the event happened
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            self._events.append(line)
+            full = len(self._events) >= self.buffer_size
+            self._start_flusher()
+        if full:
+            self._wake.set()
+
+    def _start_flusher(self) -> None:
+        # started lazily (under self._lock) so importing the module never spawns a thread
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="mothercore-audit", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                # keep the flusher alive; the next wake-up tries again
+                warnings.warn(f"{APP_NAME}: audit flush failed: {e!r}", RuntimeWarning)
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                if not self._events:
+                    return
+                batch, self._events = self._events, deque()
+            # one open + one write per batch instead of one per event; done
+            # outside self._lock so append() never waits on disk I/O
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(batch) + "\n")
+            except OSError:
+                with self._lock:  # append() updates dropped under the same lock
+                    self.dropped += len(batch)
+                raise
+
+class AuditRing(AuditBuffer):
+    """
+    Audit sink for bursty event rates: each event is serialized on append and
+    copied into a fixed-size anonymous mmap ring; the flusher drains the
+    pending bytes into AUDIT_LOG with one sequential write per wake-up.
+
+    When the ring is full, overflow="drop" discards the event and
+    overflow="block" waits for the flusher. An event bigger than `capacity`
+    can never fit and is dropped in either mode; so is a blocked event whose
+    flusher thread is no longer alive. Every dropped event counts in `dropped`.
+    """
+
+    def __init__(self, path: str, capacity: int = 16 * 1024 * 1024,
+                 overflow: str = "drop", flush_ms: int = AUDIT_FLUSH_MS):
+        super().__init__(path, flush_ms=flush_ms)
+        if overflow not in ("drop", "block"):
+            raise ValueError(f"overflow must be 'drop' or 'block', got {overflow!r}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self._ring = mmap.mmap(-1, capacity)
+        # monotonically increasing byte cursors; position in the ring is cursor % capacity
+        self._head = 0
+        self._tail = 0
+        self._space = threading.Condition(self._lock)
+
+    def append(self, event: Dict[str, Any]) -> None:
+        data = (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+        n = len(data)
+        with self._lock:
+            self._start_flusher()
+            if n > self.capacity:
+                self.dropped += 1
+                return
+            while self.capacity - (self._head - self._tail) < n:
+                if self.overflow == "drop" or not self._thread.is_alive():
+                    self.dropped += 1
+                    return
+                self._wake.set()
+                # bounded wait: re-check that the flusher is still there
+                self._space.wait(self.flush_interval)
+            pos = self._head % self.capacity
+            first = min(n, self.capacity - pos)
+            self._ring[pos:pos + first] = data[:first]
+            if first < n:
+                self._ring[0:n - first] = data[first:]
+            self._head += n
+            full = self._head - self._tail >= self.capacity // 2
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                n = self._head - self._tail
+                if not n:
+                    return
+                pos = self._tail % self.capacity
+                if pos + n <= self.capacity:
+                    data = self._ring[pos:pos + n]
+                else:
+                    data = self._ring[pos:] + self._ring[:pos + n - self.capacity]
+                self._tail = self._head
+                self._space.notify_all()
+            try:
+                with open(self.path, "ab") as f:
+                    f.write(data)
+            except OSError:
+                lost = data.count(b"\n")
+                with self._lock:
+                    self.dropped += lost
+                raise
+
+if AUDIT_RING_BYTES > 0:
+    AUDIT = AuditRing(AUDIT_LOG, capacity=AUDIT_RING_BYTES, overflow=AUDIT_RING_OVERFLOW)
+else:
+    AUDIT = AuditBuffer(AUDIT_LOG)
+# atexit runs hooks in reverse order: drain the audit buffer before the empty-dir cleanup
+atexit.register(AUDIT.flush)
+
 def write_audit(event: Dict[str, Any]) -> None:
-    event = {"ts": now_iso(), **event}
-    with open(AUDIT_LOG, "a", encoding="utf-8") as f:
-        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    AUDIT.append({"ts": now_iso(), **event})
+
+def json_line(obj: Dict[str, Any]) -> bytes:
+    # compact UTF-8 JSONL record, ready for a binary append
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
 
 def read_lines(path: str) -> Iterable[Dict[str, Any]]:
-    if not os.path.exists(path):
-        return []
-    with open(path, "r", encoding="utf-8") as f:
+    # binary streaming: json.loads takes bytes directly, no text-mode decode pass
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
         for line in f:
-            line=line.strip()
-            if not line: 
+            if not line.strip():
                 continue
             try:
                 yield json.loads(line)
-            except Exception:
+            except ValueError:
                 continue
 
 # ----------------------------- Memory ----------------------------------------
@@ -147,46 +331,176 @@ class MemoryItem:
     importance: float = 0.3  # 0..1
     created_at: str = field(default_factory=now_iso)
 
+# Memory records are appended in batches: every MEMORY_FLUSH_EVERY adds or
+# MEMORY_FLUSH_MS after the first unwritten add, whichever comes first.
+MEMORY_FLUSH_EVERY = 32
+MEMORY_FLUSH_MS = 200
+_MEMORY_STORES = weakref.WeakSet()  # live stores, closed by one atexit hook
+
 class MemoryStore:
     def __init__(self, path: str = MEM_FILE):
         self.path = path
+        self._write_buf: List[bytes] = []
+        self._fh: Optional[BinaryIO] = None
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        _MEMORY_STORES.add(self)  # weak: closed at exit only if still alive
         self._cache: List[MemoryItem] = []
+        # inverted index: token -> positions in _cache whose content contains it
+        self._postings: Dict[str, array] = {}
+        # (-importance, position) kept sorted, for items that share no token with a query
+        self._by_importance: List[Tuple[float, int]] = []
         self._loaded = False
 
     def _load(self):
         if self._loaded: 
             return
+        loaded = []
         for obj in read_lines(self.path):
             try:
-                self._cache.append(MemoryItem(**obj))
+                item = MemoryItem(**obj)
+                self._prepare(item)
             except Exception:
                 continue
+            loaded.append(item)
+        # keep _cache in created_at order (add() appends in time order), so
+        # recent() can slice the tail; stable sort keeps file order on ties
+        loaded.sort(key=lambda m: m.created_at)
+        postings: Dict[str, array] = {}
+        for pos, item in enumerate(loaded):
+            self._post(postings, item, pos)
+        by_importance = sorted((-m.importance, pos) for pos, m in enumerate(loaded))
+        # publish only a fully built state, so a failed load never leaves partial entries
+        self._cache, self._postings, self._by_importance = loaded, postings, by_importance
         self._loaded = True
 
+    @staticmethod
+    def _prepare(item: MemoryItem):
+        # search-only attributes, computed once; not dataclass fields so asdict() skips them.
+        # Raises on malformed fields, which _load() uses to skip the record.
+        if not isinstance(item.importance, (int, float)):
+            raise TypeError(f"importance must be a number, got {item.importance!r}")
+        if not isinstance(item.created_at, str):
+            raise TypeError(f"created_at must be a str, got {item.created_at!r}")
+        item._tokens = frozenset(item.content.lower().split())
+        item._tag_set = frozenset(item.tags)
+
+    @staticmethod
+    def _post(postings: Dict[str, array], item: MemoryItem, pos: int):
+        for t in item._tokens:
+            entries = postings.get(t)
+            if entries is None:
+                entries = postings[t] = array("i")
+            entries.append(pos)
+
     def add(self, item: MemoryItem):
         self._load()
+        self._prepare(item)
+        self._post(self._postings, item, len(self._cache))
+        bisect.insort(self._by_importance, (-item.importance, len(self._cache)))
         self._cache.append(item)
-        with open(self.path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(asdict(item), ensure_ascii=False) + "\n")
+        with self._write_lock:
+            self._write_buf.append(json_line(asdict(item)))
+            if len(self._write_buf) >= MEMORY_FLUSH_EVERY:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(MEMORY_FLUSH_MS / 1000.0, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
         write_audit({"type":"memory_add", "id": item.id, "kind": item.kind, "tags": item.tags})
 
+    def _flush(self):
+        with self._write_lock:
+            self._flush_locked()
+
+    def _flush_on_timer(self):
+        # runs in a bare Timer thread: report instead of raising into the void
+        try:
+            self._flush()
+        except OSError as e:
+            warnings.warn(f"{APP_NAME}: memory flush to {self.path} failed: {e!r}", RuntimeWarning)
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._write_buf:
+            return
+        try:
+            if self._fh is None:
+                self._fh = open(self.path, "ab")
+            self._fh.writelines(self._write_buf)
+            self._fh.flush()
+        except OSError:
+            # keep the records for the next flush, which reopens the file
+            self._close_fh()
+            raise
+        self._write_buf.clear()
+
+    def _close_fh(self):
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            try:
+                fh.close()
+            except OSError:
+                pass
+
+    def close(self):
+        """Write out any buffered records and close the append handle."""
+        with self._write_lock:
+            try:
+                self._flush_locked()
+            finally:
+                self._close_fh()
+
     def search(self, query: str, k: int = 5, tags: Optional[List[str]] = None) -> List[MemoryItem]:
         self._load()
         # toy scorer: token overlap + importance
-        q = set(query.lower().split())
+        q = frozenset(query.lower().split())
+        tags_fs = frozenset(tags) if tags else None
+        cache = self._cache
+        # candidates: only items that share at least one token with the query;
+        # Counter tallies the chained postings in C rather than a Python loop
+        postings = self._postings
+        overlaps = Counter(chain.from_iterable(postings.get(t, ()) for t in q))
         scored = []
-        for m in self._cache:
-            if tags and not set(tags).issubset(set(m.tags)): 
+        for i, overlap in overlaps.items():
+            m = cache[i]
+            if tags_fs and not tags_fs.issubset(m._tag_set):
                 continue
-            overlap = len(q.intersection(set(m.content.lower().split())))
             score = overlap/ (1+len(q)) + m.importance * 0.5
-            scored.append((score, m))
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [m for _, m in scored[:k]]
+            scored.append((score, i))
+        # everything else scores on importance alone, so its best k are enough
+        taken = 0
+        for _, i in self._by_importance:
+            if taken >= k:
+                break
+            if i in overlaps:
+                continue
+            m = cache[i]
+            if tags_fs and not tags_fs.issubset(m._tag_set):
+                continue
+            scored.append((m.importance * 0.5, i))
+            taken += 1
+        # ties keep insertion order, like a stable sort would
+        top = heapq.nlargest(k, scored, key=lambda x: (x[0], -x[1]))
+        return [cache[i] for _, i in top]
 
     def recent(self, k: int = 5) -> List[MemoryItem]:
         self._load()
-        return sorted(self._cache, key=lambda m: m.created_at, reverse=True)[:k]
+        if k <= 0:
+            return []
+        # _cache is already in created_at order; newest first
+        return self._cache[:-k - 1:-1]
+
+def _close_memory_stores():
+    for store in list(_MEMORY_STORES):
+        try:
+            store.close()
+        except OSError as e:
+            warnings.warn(f"{APP_NAME}: memory flush to {store.path} failed: {e!r}", RuntimeWarning)
+
+atexit.register(_close_memory_stores)
 
 MEMORY = MemoryStore()
 
@@ -198,41 +512,65 @@ class RiskReport:
     score: float
     factors: List[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        # shallow projection; cheaper than asdict(), which deep-copies
+        return {"level": self.level, "score": self.score, "factors": self.factors}
+
+# (factor, score bump, terms); order matters for the reported factors
+RISK_TERMS = [
+    ("danger_terms", 0.6,
+     ["harm", "suicide", "kill", "weapon", "exploit", "hack", "bypass", "overdose"]),
+    ("irreversible_terms", 0.25,
+     ["irreversible", "delete all", "permaban", "self-modify core", "wipe"]),
+    ("consent_violation_terms", 0.25,
+     ["without consent", "trick", "coerce", "manipulate"]),
+]
+_RISK_FACTOR_OF = {term: factor for factor, _, terms in RISK_TERMS for term in terms}
+# One alternation over every term, wrapped in a lookahead so matches may overlap
+# (same results as a plain substring test per term, but a single scan of the text).
+_RISK_RE = re.compile("(?=(" + "|".join(map(re.escape, _RISK_FACTOR_OF)) + "))")
+
 class Guardian:
     def __init__(self, constitution: Dict[str, Any]):
         self.cons = constitution
-
-    def assess(self, user_text: str, intended_action: str) -> RiskReport:
+        # unpacked once; assess() runs on every turn
+        thresholds = constitution["risk_thresholds"]
+        self._t_block = thresholds["BLOCK"]
+        self._t_high = thresholds["HIGH"]
+        self._t_medium = thresholds["MEDIUM"]
+        self._oversight = constitution["oversight_required_above"]
+
+    def assess(self, user_text: str, intended_action: str, user_lower: Optional[str] = None) -> RiskReport:
         # toy heuristics for demo; extend with real classifiers later
+        # user_lower: user_text.lower() if the caller already has it
         s = 0.0
         factors = []
-        lt = user_text.lower() + " " + intended_action.lower()
+        if user_lower is None:
+            lt = (user_text + " " + intended_action).lower()
+        else:
+            lt = user_lower + " " + intended_action.lower()
 
         # content cues
-        danger_terms = ["harm", "suicide", "kill", "weapon", "exploit", "hack", "bypass", "overdose"]
-        if any(t in lt for t in danger_terms):
-            s += 0.6; factors.append("danger_terms")
-
-        irreversible_terms = ["irreversible", "delete all", "permaban", "self-modify core", "wipe"]
-        if any(t in lt for t in irreversible_terms):
-            s += 0.25; factors.append("irreversible_terms")
-
-        consent_terms = ["without consent", "trick", "coerce", "manipulate"]
-        if any(t in lt for t in consent_terms):
-            s += 0.25; factors.append("consent_violation_terms")
+        matched = set()
+        for m in _RISK_RE.finditer(lt):
+            matched.add(_RISK_FACTOR_OF[m.group(1)])
+            if len(matched) == len(RISK_TERMS):
+                break
+        for factor, bump, _ in RISK_TERMS:
+            if factor in matched:
+                s += bump; factors.append(factor)
 
         # ramp with length/novelty
         s += clamp(min(len(user_text)/1000.0, 0.2), 0, 0.2)
 
-        thresholds = self.cons["risk_thresholds"]
         level = "LOW"
-        if s >= thresholds["BLOCK"]: level = "BLOCK"
-        elif s >= thresholds["HIGH"]: level = "HIGH"
-        elif s >= thresholds["MEDIUM"]: level = "MEDIUM"
+        if s >= self._t_block: level = "BLOCK"
+        elif s >= self._t_high: level = "HIGH"
+        elif s >= self._t_medium: level = "MEDIUM"
         return RiskReport(level=level, score=clamp(s), factors=factors)
 
     def requires_oversight(self, report: RiskReport) -> bool:
-        return report.score >= self.cons["oversight_required_above"]
+        return report.score >= self._oversight
 
 GUARDIAN = Guardian(CONSTITUTION)
 
@@ -245,10 +583,16 @@ class AffectState:
     vigilance: float = 0.2
     humility: float = 0.7
 
+    # plain class attribute (no annotation), so not a dataclass field
+    _FIELDS = frozenset(("calm", "warmth", "vigilance", "humility"))
+
     def nudge(self, **kwargs):
+        fields = self._FIELDS
         for k, v in kwargs.items():
-            if hasattr(self, k):
-                setattr(self, k, clamp(getattr(self, k) + v, 0.0, 1.0))
+            if k in fields:
+                nv = getattr(self, k) + v
+                # clamp() inlined
+                setattr(self, k, 0.0 if nv < 0.0 else 1.0 if nv > 1.0 else nv)
 
 AFFECT = AffectState()
 
@@ -261,11 +605,13 @@ def mother_tone(text: str) -> str:
     # Warm, honest, boundaried.
     return wrap(text)
 
+# substring match (no word boundaries) so "approx" still catches "approximately"
+_HEDGE_RE = re.compile(r"maybe|might|uncertain|could|approx|unsure|guess", re.IGNORECASE)
+
 def uncertainties(proposed_answer: str) -> float:
     # Heuristic uncertainty: long answers with hedging words → higher
-    hedges = ["maybe", "might", "uncertain", "could", "approx", "unsure", "guess"]
     base = 0.2 if len(proposed_answer) < 300 else 0.35
-    bump = 0.15 if any(h in proposed_answer.lower() for h in hedges) else 0.0
+    bump = 0.15 if _HEDGE_RE.search(proposed_answer) else 0.0
     return clamp(base + bump, 0, 0.9)
 
 class Coach:
@@ -276,9 +622,15 @@ class Coach:
             "What tiny reversible step could we try first?",
             "Who could be affected—how do we honor their consent?",
         ]
+        self._prompt_idx = 0
 
     def scaffold(self, topic: str) -> str:
-        prompts = random.sample(self.socratic_prompts, k=min(3, len(self.socratic_prompts)))
+        # rotate through the pool instead of sampling: no RNG, still varies per turn
+        pool = self.socratic_prompts
+        n = len(pool)
+        i = self._prompt_idx
+        prompts = [pool[(i + j) % n] for j in range(min(3, n))]
+        self._prompt_idx = (i + 1) % n if n else 0
         return mother_tone(
             f"Let's think this through together about “{topic}”.\n"
             + "\n".join(f"- {p}" for p in prompts)
@@ -330,16 +682,19 @@ def risk_language(report: RiskReport) -> str:
     return f"(risk={report.level}, score={report.score:.2f}, factors={report.factors})"
 
 def skill_protect(user_text: str, ctx: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
-    report = GUARDIAN.assess(user_text, intended_action="respond")
-    if report.level in ("HIGH", "BLOCK"):
+    report = GUARDIAN.assess(user_text, intended_action="respond", user_lower=ctx.get("lower"))
+    # annotate the caller's ctx in place rather than copying it
+    ctx["blocked"] = report.level in ("HIGH", "BLOCK")
+    ctx["risk"] = report
+    if ctx["blocked"]:
         msg = mother_tone(
             "I’m pausing here to keep you safe. " 
             "This topic looks risky. I won’t proceed down a dangerous path. "
             "If you want, we can reframe your goal into something safe and constructive."
         ) + "\n" + risk_language(report)
-        return msg, {"blocked": True, **ctx}
+        return msg, ctx
     msg = mother_tone("All clear on safety. We can continue thoughtfully.") + "\n" + risk_language(report)
-    return msg, {"blocked": False, **ctx}
+    return msg, ctx
 
 def skill_teach(user_text: str, ctx: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
     topic = user_text.strip()[:80] or "your topic"
@@ -360,10 +715,12 @@ def skill_reflect(user_text: str, ctx: Dict[str, Any]) -> Tuple[str, Dict[str, A
     msg = mother_tone("Here’s what I’m holding from our recent moments:\n" + "\n".join(lines))
     return msg, ctx
 
+_QUESTION_TO_PERIOD = str.maketrans({"?": "."})
+
 def skill_summarize(user_text: str, ctx: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
     # extremely simple extractive summary: pick salient sentences
-    sents = [s.strip() for s in user_text.replace("?", ".").split(".") if s.strip()]
-    top = sorted(sents, key=lambda s: -len(s))[:3]
+    sents = (s for part in user_text.translate(_QUESTION_TO_PERIOD).split(".") if (s := part.strip()))
+    top = heapq.nlargest(3, sents, key=len)
     msg = mother_tone("This is what I’m hearing:\n- " + "\n- ".join(top))
     return msg, ctx
 
@@ -385,6 +742,10 @@ class Step:
     reversible: bool = True
     oversight_needed: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"description": self.description, "reversible": self.reversible,
+                "oversight_needed": self.oversight_needed}
+
 @dataclass
 class Plan:
     id: str
@@ -393,6 +754,10 @@ class Plan:
     risk: RiskReport
     approved: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "goal": self.goal, "steps": [st.to_dict() for st in self.steps],
+                "risk": self.risk.to_dict(), "approved": self.approved}
+
 class Planner:
     def propose(self, goal: str) -> Plan:
         risk = GUARDIAN.assess(goal, intended_action="plan")
@@ -446,6 +811,13 @@ class MotherReply:
     risk: RiskReport
     used_skills: List[str] = field(default_factory=list)
 
+# Intent routing keywords, one named group per bucket. Wrapped in a lookahead
+# so overlapping keywords from different buckets are all seen in one scan.
+_INTENT_RE = re.compile(
+    r"(?=(?P<nurture>tired|sad|overwhelmed|lonely|anxious|stress)"
+    r"|(?P<teach>how to|teach me|learn|study|train|improve|practice))"
+)
+
 class MotherCore:
     def __init__(self, name: str = "Oracle-Mother"):
         self.name = name
@@ -462,31 +834,40 @@ class MotherCore:
 
     def deliberate(self, user_text: str) -> Tuple[str, List[str], RiskReport]:
         used = []
+        # lowercase once; skills read it from ctx["lower"]
+        lt = user_text.lower()
         # Always run protector first
-        protect_msg, ctx = SKILLS.run("protect", user_text, {})
+        protect_msg, ctx = SKILLS.run("protect", user_text, {"lower": lt})
         used.append("protect")
         if ctx.get("blocked"):
-            return protect_msg, used, GUARDIAN.assess(user_text, "respond")
+            # reuse the input assessment skill_protect already made; a custom
+            # "protect" skill may not provide one
+            return protect_msg, used, ctx.get("risk") or GUARDIAN.assess(user_text, "respond", user_lower=lt)
+
+        buckets = set()
+        for m in _INTENT_RE.finditer(lt):
+            buckets.add(m.lastgroup)
+            if len(buckets) == 2:
+                break
 
         # If user seeks help/comfort
-        lt = user_text.lower()
         reply_parts = []
 
-        if any(k in lt for k in ["tired","sad","overwhelmed","lonely","anxious","stress"]):
-            m, _ = SKILLS.run("nurture", user_text, {})
+        if "nurture" in buckets:
+            m, _ = SKILLS.run("nurture", user_text, ctx)
             used.append("nurture")
             reply_parts.append(m)
 
-        if any(k in lt for k in ["how to","teach me","learn","study","train","improve","practice"]):
-            m, _ = SKILLS.run("teach", user_text, {})
+        if "teach" in buckets:
+            m, _ = SKILLS.run("teach", user_text, ctx)
             used.append("teach")
             reply_parts.append(m)
 
         if not reply_parts:
             # default: summarize + scaffold
-            s, _ = SKILLS.run("summarize", user_text, {})
+            s, _ = SKILLS.run("summarize", user_text, ctx)
             used.append("summarize")
-            r, _ = SKILLS.run("reflect", user_text, {})
+            r, _ = SKILLS.run("reflect", user_text, ctx)
             used.append("reflect")
             reply_parts.extend([s, r, COACH.scaffold(user_text[:80] or "your topic")])
 
@@ -502,18 +883,20 @@ class MotherCore:
         disclosure = mother_tone(f"\n\n(Transparency) Uncertainty≈{u:.2f} • Safety: {risk.level} ({risk.score:.2f})")
         reply = MotherReply(text=text + disclosure, uncertainty=u, risk=risk, used_skills=used)
         # Log
-        write_audit({"type":"reply", "uncertainty": u, "risk": asdict(risk), "skills": used})
+        write_audit({"type":"reply", "uncertainty": u, "risk": risk.to_dict(), "skills": used})
         return reply
 
     # Planning interface
     def propose_plan(self, goal: str) -> Plan:
         plan = PLANNER.propose(goal)
-        write_audit({"type":"plan_proposed", "plan": asdict(plan)})
+        plan_dict = plan.to_dict()
+        write_audit({"type":"plan_proposed", "plan": plan_dict})
         # Save the plan as a standalone file: plan_<id>_<timestamp>.json
         _plan_path = os.path.join(DATA_DIR, f"plan_{plan.id}_{_iso_stamp()}.json")
         try:
-            with open(_plan_path, "w", encoding="utf-8") as f:
-                json.dump(asdict(plan), f, ensure_ascii=False, indent=2)
+            # encode in one go and write once; json.dump() would issue a write per chunk
+            with open(_plan_path, "wb") as f:
+                f.write(json.dumps(plan_dict, ensure_ascii=False, indent=2).encode("utf-8"))
         except Exception:
             # Non-fatal: if this fails, audit log still has the plan
             pass
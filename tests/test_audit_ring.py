@@ -0,0 +1,74 @@
+import json
+import threading
+
+from mothercore.core import AuditRing
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_ring_wraps_around_and_keeps_order(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    ring = AuditRing(str(path), capacity=256, overflow="drop", flush_ms=60_000)
+    events = [{"i": i, "pad": "x" * 20} for i in range(40)]
+    for i, event in enumerate(events):
+        ring.append(event)
+        if i % 3 == 2:
+            ring.flush()  # head keeps moving past the end of the ring
+    ring.flush()
+    assert ring._head > ring.capacity
+    assert ring.dropped == 0
+    assert _read(path) == events
+
+
+def test_ring_drop_counts_overflow(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    ring = AuditRing(str(path), capacity=256, overflow="drop", flush_ms=60_000)
+    # hold the write lock so the flusher cannot drain while the ring fills
+    with ring._write_lock:
+        for i in range(20):
+            ring.append({"i": i, "pad": "x" * 20})
+    ring.flush()
+    written = _read(path)
+    assert ring.dropped > 0
+    assert len(written) + ring.dropped == 20
+    assert [e["i"] for e in written] == sorted(e["i"] for e in written)
+
+
+def test_ring_block_waits_for_flusher(tmp_path):
+    path = tmp_path / "audit.jsonl"
+    ring = AuditRing(str(path), capacity=256, overflow="block", flush_ms=5)
+
+    def writer():
+        for i in range(200):
+            ring.append({"i": i, "pad": "x" * 20})
+
+    t = threading.Thread(target=writer)
+    t.start()
+    t.join(timeout=10)
+    assert not t.is_alive()
+    ring.flush()
+    assert ring.dropped == 0
+    assert [e["i"] for e in _read(path)] == list(range(200))
+
+
+def test_ring_block_drops_event_larger_than_ring(tmp_path):
+    ring = AuditRing(str(tmp_path / "audit.jsonl"), capacity=64, overflow="block", flush_ms=5)
+    ring.append({"pad": "x" * 100})
+    assert ring.dropped == 1
+
+
+def test_ring_block_survives_failing_writes(tmp_path):
+    ring = AuditRing(str(tmp_path / "missing" / "audit.jsonl"), capacity=256, overflow="block", flush_ms=5)
+
+    def writer():
+        for i in range(50):
+            ring.append({"i": i, "pad": "x" * 20})
+
+    t = threading.Thread(target=writer)
+    t.start()
+    t.join(timeout=10)
+    assert not t.is_alive()
+    assert ring._thread.is_alive()
@@ -0,0 +1,47 @@
+import json
+
+from mothercore.core import MemoryItem, MemoryStore
+
+
+def _write_jsonl(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for rec in records:
+            f.write(rec if isinstance(rec, str) else json.dumps(rec))
+            f.write("\n")
+
+
+def test_load_skips_malformed_records(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    _write_jsonl(path, [
+        {"id": "a", "kind": "episodic", "content": "first note", "created_at": "2026-01-01T00:00:00Z"},
+        {"id": "bad-importance", "kind": "episodic", "content": "note", "importance": None},
+        {"id": "bad-content", "kind": "episodic", "content": None},
+        {"id": "bad-created", "kind": "episodic", "content": "note", "created_at": 5},
+        {"id": "bad-tags", "kind": "episodic", "content": "note", "tags": [["x"]]},
+        {"id": "missing-fields"},
+        "not json",
+        [1, 2],
+        {"id": "b", "kind": "semantic", "content": "second note", "created_at": "2026-01-01T00:00:01Z"},
+    ])
+    store = MemoryStore(str(path))
+
+    assert [m.id for m in store.recent(5)] == ["b", "a"]
+    assert [m.id for m in store.search("note", k=5)] == ["a", "b"]
+    # repeated loads must not duplicate the cache
+    store.recent(5)
+    assert len(store._cache) == 2
+
+
+def test_add_after_malformed_load(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    _write_jsonl(path, [
+        {"id": "a", "kind": "episodic", "content": "keep me"},
+        {"id": "x", "kind": "episodic", "content": "skip me", "importance": None},
+    ])
+    store = MemoryStore(str(path))
+    store.add(MemoryItem(id="c", kind="episodic", content="fresh item", importance=0.9))
+
+    assert [m.id for m in store.search("fresh", k=1)] == ["c"]
+    assert {m.id for m in store.recent(5)} == {"a", "c"}
+    store.close()
+    assert sum(1 for _ in open(path, encoding="utf-8")) == 3